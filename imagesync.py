@@ -15,6 +15,7 @@ from modules.collect import Collector
 from modules.transfer import Transfer
 from modules.utils.config import Config
 from modules.utils.image import Image
+from modules.utils.shard import Shard
 from common.utils import logger as iblogger
 
 log = iblogger.setup()
@@ -51,6 +52,16 @@ def main():
         help="skip TLS verify for destination registry (overrides config setting)",
         action="store_true",
     )
+    sync_subparser.add_argument(
+        "-s",
+        "--shard",
+        help="only sync shard i of N (e.g. 2/4) so multiple runners can each sync a disjoint subset of images",
+        type=Shard.parse,
+    )
+    sync_subparser.add_argument(
+        "--summary",
+        help="path to write a JSON summary of the sync to.  Defaults to sync-summary-<i>-of-<N>.json when --shard is passed",
+    )
 
     args = parser.parse_args()
     if not args.command:
@@ -142,12 +153,25 @@ def main():
             config.destination["secure"] = False
         # Instantiate Transfer
         transferer = Transfer(config)
+        summary_file = args.summary
+        if args.shard:
+            transferer.select_shard(args.shard)
+            log.info(
+                f"Syncing shard {args.shard}: {len(transferer.images)} of {len(config.images)} images"
+            )
+            summary_file = (
+                summary_file
+                or f"sync-summary-{args.shard.index}-of-{args.shard.count}.json"
+            )
         # Execute Transfer
         try:
             transferer.execute()
         except CalledProcessError as e:
             log.error(f"Error returned from transfer: {e.stderr}")
             sys.exit(1)
+        finally:
+            if summary_file:
+                transferer.write_summary(summary_file)
 
 
 if __name__ == "__main__":
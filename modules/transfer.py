@@ -1,5 +1,6 @@
 import subprocess
 import re
+import json
 
 from pathlib import Path
 from pipeline.utils.exceptions import GenericSubprocessError
@@ -16,6 +17,13 @@ class Transfer:
         self.insecure = config.source["insecure"]
         self.images = config.images
         self.cosign_verifiers = config.cosign_verifiers
+        self.shard = None
+        self.results = dict(copied=[], skipped=[], failed=[], not_attempted=[])
+
+    def select_shard(self, shard):
+        # Only transfer the images owned by this shard
+        self.shard = shard
+        self.images = shard.select(self.images)
 
     def _select_verifier(self, source):
         for verifier in self.cosign_verifiers:
@@ -43,6 +51,7 @@ class Transfer:
                         "Image skipped due to failed cosign verification: %s",
                         source.name,
                     )
+                    self.results["skipped"].append(source.name)
                     continue
             destination = Image.new_registry(source, self.registry)
             cmd = [
@@ -55,5 +64,25 @@ class Transfer:
             cmd += ["--insecure"] if self.insecure else []
 
             log.info(f"[{count}/{total_images}] Copying {source} to {destination}")
-            copy_result = subprocess.run(args=cmd, capture_output=True, check=True)
+            try:
+                copy_result = subprocess.run(args=cmd, capture_output=True, check=True)
+            except subprocess.CalledProcessError:
+                # The transfer stops here, so record the rest of the images as not attempted
+                self.results["failed"].append(source.name)
+                self.results["not_attempted"] = [
+                    image.name for image in self.images[count + 1 :]
+                ]
+                raise
             log.info(copy_result.stdout.decode())
+            self.results["copied"].append(source.name)
+
+    def write_summary(self, path):
+        summary = dict(
+            shard=str(self.shard) if self.shard else None,
+            registry=self.registry,
+            images=[image.name for image in self.images],
+            **self.results,
+        )
+        log.info("Writing transfer summary to %s", path)
+        with open(path, "w") as f:
+            json.dump(summary, f, indent=2)
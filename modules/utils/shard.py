@@ -0,0 +1,59 @@
+import argparse
+import hashlib
+
+from dataclasses import dataclass
+from .image import Image
+
+
+@dataclass(frozen=True)
+class Shard:
+    """
+    One of `count` disjoint partitions of the images in images.yaml, numbered 1 through `count`
+    """
+
+    index: int
+    count: int
+
+    def __post_init__(self):
+        if self.count < 1:
+            raise ValueError(f"Shard count must be at least 1, got {self.count}")
+        if not 1 <= self.index <= self.count:
+            raise ValueError(
+                f"Shard index must be between 1 and {self.count}, got {self.index}"
+            )
+
+    def __str__(self):
+        return f"{self.index}/{self.count}"
+
+    @classmethod
+    def parse(cls, value: str):
+        """
+        Parse a shard specified as `i/N`, e.g. `2/4`.  Raises ArgumentTypeError so argparse reports the message when used as a `type=`
+        """
+        try:
+            index, count = (int(part) for part in value.split("/"))
+        except ValueError:
+            raise argparse.ArgumentTypeError(
+                f"Shard must be specified as i/N, got '{value}'"
+            )
+        try:
+            return cls(index, count)
+        except ValueError as e:
+            raise argparse.ArgumentTypeError(str(e))
+
+    def owner(self, image: Image) -> int:
+        """
+        Rendezvous hash the image's bare repository (registry and repo, without tag or digest) to pick the shard that owns it.
+        All tags and digests of a repository (which usually share layers) land on the same shard,
+        and growing the shard count from N to N+1 only moves ~1/(N+1) of the repositories.
+        """
+        key = f"{image.registry()}/{image.repo().split('@')[0]}"
+        return max(
+            range(1, self.count + 1),
+            key=lambda candidate: hashlib.sha256(
+                f"{candidate}:{key}".encode()
+            ).digest(),
+        )
+
+    def select(self, images: list[Image]) -> list[Image]:
+        return [image for image in images if self.owner(image) == self.index]
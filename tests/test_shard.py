@@ -0,0 +1,57 @@
+import argparse
+import pytest
+
+from modules.utils.image import Image
+from modules.utils.shard import Shard
+
+IMAGES = [
+    Image(f"registry.example.com/org/repo{i}:{tag}")
+    for i in range(200)
+    for tag in ("1.0", "2.0")
+]
+
+
+def test_parse():
+    assert Shard.parse("2/4") == Shard(2, 4)
+    assert str(Shard.parse("2/4")) == "2/4"
+
+
+@pytest.mark.parametrize("value", ["0/4", "5/4", "a/b", "1/2/3"])
+def test_parse_rejects_invalid(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        Shard.parse(value)
+
+
+def test_parse_reports_message_through_argparse(capsys):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--shard", type=Shard.parse)
+    with pytest.raises(SystemExit):
+        parser.parse_args(["--shard", "5/4"])
+    assert "Shard index must be between 1 and 4, got 5" in capsys.readouterr().err
+
+
+def test_select_is_disjoint_and_complete():
+    shards = [Shard(index, 4).select(IMAGES) for index in range(1, 5)]
+    selected = [image for shard in shards for image in shard]
+    assert len(selected) == len(IMAGES)
+    assert set(selected) == set(IMAGES)
+
+
+def test_select_is_deterministic():
+    assert Shard(3, 4).select(IMAGES) == Shard(3, 4).select(IMAGES)
+
+
+def test_growing_shard_count_only_moves_to_new_shard():
+    for image in IMAGES:
+        before = Shard(1, 4).owner(image)
+        after = Shard(1, 5).owner(image)
+        assert after in (before, 5)
+
+
+def test_tags_and_digests_of_a_repository_share_a_shard():
+    shard = Shard(1, 8)
+    owners = {
+        shard.owner(Image(name))
+        for name in ["foo", "foo:1.0", "foo@sha256:abc", "foo:1.0@sha256:abc"]
+    }
+    assert len(owners) == 1
@@ -0,0 +1,100 @@
+import json
+import subprocess
+import sys
+import pytest
+import yaml
+
+import imagesync
+from modules import transfer
+from modules.transfer import Transfer
+from modules.utils.config import Config
+from modules.utils.shard import Shard
+from pipeline.utils.exceptions import GenericSubprocessError
+
+CONFIG = dict(
+    destination={"registry": "localhost:5000"},
+    source={"insecure": False},
+    cosign_verifiers=[
+        {"registry": "registry1.dso.mil", "repo": "ironbank/.*", "key": "/app/ib.pub"}
+    ],
+    images=[
+        {"name": "docker.io/library/busybox:latest"},
+        {"name": "registry1.dso.mil/ironbank/unsigned:1.0"},
+        {"name": "quay.io/org/broken:1.0"},
+        {"name": "docker.io/library/nginx:1.23.3"},
+    ],
+    include=[],
+    exclude=[],
+)
+
+
+@pytest.fixture
+def copy(monkeypatch):
+    """
+    Patch crane copy and cosign verification: images from quay.io fail to copy and images from registry1.dso.mil fail verification
+    """
+
+    def run(args, **kwargs):
+        if args[2].startswith("quay.io/"):
+            raise subprocess.CalledProcessError(1, args, stderr=b"copy failed")
+        return subprocess.CompletedProcess(args, 0, stdout=b"", stderr=b"")
+
+    def verify(image, **kwargs):
+        raise GenericSubprocessError()
+
+    monkeypatch.setattr(transfer.subprocess, "run", run)
+    monkeypatch.setattr(transfer.Cosign, "verify", verify)
+
+
+def test_execute_records_results(copy):
+    transferer = Transfer(Config(**CONFIG))
+    with pytest.raises(subprocess.CalledProcessError):
+        transferer.execute()
+
+    assert transferer.results == dict(
+        copied=["docker.io/library/busybox:latest"],
+        skipped=["registry1.dso.mil/ironbank/unsigned:1.0"],
+        failed=["quay.io/org/broken:1.0"],
+        not_attempted=["docker.io/library/nginx:1.23.3"],
+    )
+
+
+def test_write_summary(copy, tmp_path):
+    transferer = Transfer(Config(**CONFIG))
+    transferer.select_shard(Shard(1, 1))
+    with pytest.raises(subprocess.CalledProcessError):
+        transferer.execute()
+    transferer.write_summary(tmp_path / "summary.json")
+
+    summary = json.loads((tmp_path / "summary.json").read_text())
+    assert summary["shard"] == "1/1"
+    assert summary["registry"] == "localhost:5000"
+    assert summary["images"] == [image["name"] for image in CONFIG["images"]]
+    for result, images in transferer.results.items():
+        assert summary[result] == images
+
+
+@pytest.mark.parametrize(
+    "extra_args, summary_file",
+    [
+        (["--shard", "1/1"], "sync-summary-1-of-1.json"),
+        (["--shard", "1/1", "--summary", "merged/shard.json"], "merged/shard.json"),
+        (["--summary", "summary.json"], "summary.json"),
+    ],
+)
+def test_sync_writes_summary_on_failure(
+    copy, tmp_path, monkeypatch, extra_args, summary_file
+):
+    (tmp_path / "merged").mkdir()
+    (tmp_path / "images.yaml").write_text(yaml.dump(CONFIG))
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(
+        sys, "argv", ["imagesync.py", "-f", "images.yaml", "sync", *extra_args]
+    )
+
+    with pytest.raises(SystemExit):
+        imagesync.main()
+
+    summary = json.loads((tmp_path / summary_file).read_text())
+    assert summary["failed"] == ["quay.io/org/broken:1.0"]
+    assert summary["not_attempted"] == ["docker.io/library/nginx:1.23.3"]